@@ -57,14 +57,18 @@ ensure_single_vmid_or_none() {
 
 wait_until_off() {
   local vmid="$1"
-  # Poll pvectl status --onoff until 'off'
+  # Poll pvectl status --onoff until 'off', backing off exponentially
+  # (0.25s start, x1.5, 5s cap, +/-20% jitter): fast tasks are detected
+  # quickly without hammering the API when the install takes minutes.
+  local delay=0.25
   while true; do
     local state
     state=$("$PVECTL" status "$vmid" --onoff || echo "unknown")
     if [[ "$state" == "off" ]]; then
       break
     fi
-    sleep 5
+    sleep "$(awk -v d="$delay" 'BEGIN { srand(); printf "%.2f", d * (0.8 + 0.4 * rand()) }')"
+    delay=$(awk -v d="$delay" 'BEGIN { d *= 1.5; if (d > 5) d = 5; printf "%.2f", d }')
   done
 }
 
@@ -81,21 +85,25 @@ else
   echo "No existing VM named ${VM_NAME}; continuing" >&2
 fi
 
+# Fetch the ISO listing once; both presence checks below key off it
+ISO_LIST=$("$PVECTL" iso list --storage "$ISO_STORAGE")
+
 # Delete prior overlay ISO if present
-if "$PVECTL" iso list --storage "$ISO_STORAGE" | grep -Fx "$OVERLAY_ISO" >/dev/null; then
+if printf "%s\n" "$ISO_LIST" | grep -Fx "$OVERLAY_ISO" >/dev/null; then
   echo "Deleting existing overlay ISO ${OVERLAY_ISO} from ${ISO_STORAGE}..." >&2
   "$PVECTL" iso delete --storage "$ISO_STORAGE" --name "$OVERLAY_ISO"
 fi
 
-# --- Build the overlay ISO ---
+# --- Build the overlay ISO (in background; independent of the Alpine ISO check) ---
 if [[ ! -x ./alpine-answers ]]; then
   die "Missing or non-executable ./alpine-answers"
 fi
-./alpine-answers --hostname "$VM_NAME" --iso "$OVERLAY_ISO"
+./alpine-answers --hostname "$VM_NAME" --iso "$OVERLAY_ISO" &
+BUILD_PID=$!
 
-# --- Ensure Alpine ISO present; upload overlay ISO ---
+# --- Ensure Alpine ISO present while the overlay builds ---
 ALPINE_ISO=$(python3 ./alpine-latest)
-if ! "$PVECTL" iso list --storage "$ISO_STORAGE" | grep -Fx "$ALPINE_ISO" >/dev/null; then
+if ! printf "%s\n" "$ISO_LIST" | grep -Fx "$ALPINE_ISO" >/dev/null; then
   echo "Alpine ISO ${ALPINE_ISO} not present; downloading and uploading..." >&2
   python3 ./alpine-latest --fetch --dir .
   "$PVECTL" iso upload --storage "$ISO_STORAGE" --file "$ALPINE_ISO"
@@ -103,7 +111,8 @@ else
   echo "Alpine ISO ${ALPINE_ISO} already present in ${ISO_STORAGE}" >&2
 fi
 
-# Upload the overlay ISO
+# Wait for the overlay build before uploading it
+wait "$BUILD_PID" || die "Overlay build failed"
 "$PVECTL" iso upload --storage "$ISO_STORAGE" --file "$OVERLAY_ISO"
 
 # --- Create VM ---